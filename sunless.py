@@ -22,12 +22,15 @@ call load_data() to load a single data type.
 """
 # pylint: disable=too-few-public-methods,too-many-lines,unused-import
 
+from array import array
 import collections
-from contextlib import closing
 from enum import IntEnum
 import io
-from os import path
-from struct import unpack
+from operator import attrgetter
+from os import environ, path
+from struct import Struct, calcsize
+import sys
+from time import perf_counter
 
 __all__ = [
     'Area', 'AspectQPossession', 'Availability', 'Bargain',
@@ -43,52 +46,85 @@ __all__ = [
     'load_all', 'load_data']
 
 _DEBUG = False
+# Set SUNLESS_PROFILE in the environment to have load_all() report how long
+# each file took to parse, on stderr.
+_PROFILE = bool(environ.get('SUNLESS_PROFILE'))
+
+# Pre-compiled unpackers for the fixed-size scalar types. These are bound
+# methods, so that the generated code doesn't even need an attribute lookup.
+_unpack_int32 = Struct('<i').unpack
+_unpack_int32_from = Struct('<i').unpack_from
+_unpack_int64 = Struct('<q').unpack
+_unpack_float = Struct('<f').unpack
+
+# The struct format codes for fields that are always a fixed size, used to
+# read runs of them at once. bool is read as an unsigned byte, to match
+# read_bool().
+_FIXED_FORMATS = {'bool': 'B', 'enum': 'i', 'float': 'f', 'int32': 'i'}
+
+# int32 arrays are bulk-decoded with array('i'), which uses the machine's
+# byte order and C int size. The data is always little-endian.
+_BIG_ENDIAN = sys.byteorder == 'big'
+assert array('i').itemsize == 4, "array('i') must hold 4-byte ints"
+
+# The bytes that are allowed in a Unity header name, 0x41 to 0x7A inclusive.
+_HEADER_NAME_BYTES = bytes(range(0x41, 0x7B))
+
+class _DebugBytesIO(io.BytesIO):
+    """BytesIO that prints everything that gets read, for _DEBUG"""
+
+    def read(self, size=-1, /):
+        result = super().read(size)
+        print(f'Read {result!r}')
+        return result
 
 class _Reader:
-    """Reads binary data from a file stream.
-
-    This class mostly just exposes read_fun() and tell_fun() as underlying
-    functons to call, rather than performing reading itself. This is because
-    of the inlining done by the _Codegen class, which reduces function calls
-    to the minimum possible. (BufferedReader.read() is a native function,
-    generally.)
+    """Reads binary data from an in-memory copy of a file.
+
+    This class mostly just exposes read_fun() as an underlying function to
+    call, rather than performing reading itself. This is because of the
+    inlining done by the _Codegen class, which reduces function calls to the
+    minimum possible. (BytesIO.read() is a native function.) The rare code
+    paths that need to seek or tell get to the stream via read_fun.__self__,
+    so that it's the only thing passed around by the generated code.
+
+    The whole file is slurped up front, so that parsing never has to go back
+    to the OS, and the reads don't pay for BufferedReader's locking and
+    buffer management. This also means there is nothing to close: the file
+    itself is closed before the constructor returns.
+
+    Where the time goes: parsing is bound by interpreter overhead, i.e. the
+    bytecode and native calls made per field, plus allocating the Python
+    objects for the results. It is not bound by moving bytes around; the
+    files are small and get read once. So optimizations should cut the
+    number of calls and allocations per field (see _Codegen), rather than
+    make the byte handling itself faster. Set SUNLESS_PROFILE=1 to get
+    per-file timings from load_all(), or use cProfile for more detail.
     """
-    __slots__ = ('buf_reader', 'read_fun', 'tell_fun')
+    __slots__ = ('buf_reader', 'read_fun')
 
     def __init__(self, filename, /):
-        self.buf_reader = io.BufferedReader(io.FileIO(filename))
-        self.tell_fun = self.buf_reader.tell
-        if not _DEBUG:
-            self.read_fun = self.buf_reader.read
-        else:
-            read_fun = self.buf_reader.read
-            def print_wrapper(count=None):
-                result = read_fun(count)
-                print(f'Read {result!r}')
-                return result
-            self.read_fun = print_wrapper
+        # Unbuffered, since the whole file is read at once: FileIO.readall()
+        # sizes its buffer from fstat() and reads straight into it.
+        with open(filename, 'rb', buffering=0) as fil:
+            data = fil.read()
+        self.buf_reader = (_DebugBytesIO if _DEBUG else io.BytesIO)(data)
+        self.read_fun = self.buf_reader.read
         # Check if the file has Unity header bits, and skip them if so.
-        # Takes advantage of the fact that peek returns the whole buffer.
-        start = self.buf_reader.peek()
-        name_len = int.from_bytes(start[:4], 'little')
-        if name_len < 20:  # If it is a reasonable size...
+        name_len = int.from_bytes(data[:4], 'little')
+        # A zero length is excluded: that is also how a header-less file
+        # holding an empty array starts.
+        if 0 < name_len < 20:  # If it is a reasonable size...
             padding = -name_len & 3
             blen = name_len + 4 + padding
             # If all the padding bytes are zero, and the name is entirely in
             # the upper/lowercase range, we can safely assume it's a Unity
             # header. That means skipping the name, name padding, plus 8 bytes
             # for the name length and the content length.
-            if start[name_len+4:blen] == b'\0' * padding and all(
-                0x40 < x <= 0x7A for x in start[4:name_len+4]):
-                self.read_fun(blen + 4)
-
-    def get_funcs(self):
-        """Return the accessors"""
-        return self.read_fun, self.tell_fun
-
-    def close(self):
-        """Close the reader"""
-        self.buf_reader.close()
+            # (Deleting all the name bytes leaves nothing if that is true.)
+            if data[name_len+4:blen] == b'\0' * padding and not data[
+                4:name_len+4].translate(None, _HEADER_NAME_BYTES):
+                self.buf_reader.seek(blen + 4)
 
 
 class _Codegen:
@@ -104,8 +140,8 @@ class _Codegen:
 
     Almost all of the code snippets are expressions, which allows them to be
     recursively inlined into larger snippets by simply calling the appropriate
-    function. The exception is read_array, which returns a sequence of
-    statements.
+    function. The exceptions are read_array and read_fixed_run, which return
+    a sequence of statements.
 
     Some code is too complicated to be done in an expression, and is
     implemented in an actual function. These are annotated with @staticmethed,
@@ -114,40 +150,63 @@ class _Codegen:
 
     def read_float(self):
         """Read a single-precision float"""
-        return "unpack('f', read_fun(4))[0]"
+        return '_unpack_float(read_fun(4))[0]'
 
     def read_varint(self):
-        """Read a varint value from the stream"""
-        return '_Codegen._read_varint_real(read_fun)'
+        """Read a varint value from the stream
+
+        The overwhelmingly common case is a single-byte varint, so that is
+        decoded inline, and only multi-byte values pay for a function call.
+        """
+        return ('(vbyte if (vbyte := read_fun(1)[0]) < 0x80 else ' +
+                '_read_varint_rest(vbyte, read_fun))')
 
     @staticmethod
     def _read_varint_real(read_fun):
         """Performs actual varint decoding"""
-        shift = 0
-        acc = 0
+        return _Codegen._read_varint_rest(read_fun(1)[0], read_fun)
+
+    @staticmethod
+    def _read_varint_rest(byte, read_fun):
+        """Finishes varint decoding, given the first byte"""
+        if byte < 0x80:
+            return byte
+        # Two bytes covers every string up to 16K, so it gets special-cased
+        # to avoid the loop.
+        byte2 = read_fun(1)[0]
+        if byte2 < 0x80:
+            return byte & 0x7F | byte2 << 7
+        shift = 7
+        acc = byte & 0x7F
+        byte = byte2
         while True:
-            byte = read_fun(1)[0]
             acc |= (byte & 0x7F) << shift
             if not byte & 0x80:
                 break
             shift += 7
+            byte = read_fun(1)[0]
         return acc
 
     def _read_byte(self):
         """Helper for reading a single byte
 
-        Also used as a shortcut for read_bool when a generic truthy value is
-        good enough, instead of an actual bool.
+        Also used for read_bool, since a generic truthy value is good enough
+        there instead of an actual bool.
         """
         return 'read_fun(1)[0]'
 
     def read_bool(self):
-        """Helper for reading a single bool"""
-        return f'bool({self._read_byte()})'
+        """Helper for reading a single bool
+
+        This is stored as the raw byte (0 or 1) rather than converted to an
+        actual bool, which saves a call per field. Everything that consumes
+        these only cares about truthiness.
+        """
+        return self._read_byte()
 
     def read_int32(self):
         """Helper for reading a single int32"""
-        return "int.from_bytes(read_fun(4), 'little', signed=True)"
+        return '_unpack_int32(read_fun(4))[0]'
 
     def read_optional_int32(self):
         """Read an optional int32, returning None if not present"""
@@ -156,15 +215,16 @@ class _Codegen:
     def read_optional_int64(self):
         """Read an optional int64, returning None if not present
 
-        There aren't actually any int64s in the data.
+        There aren't actually any int64s in the data, but they're decoded the
+        same way as int32s in case any turn up.
         """
-        return 'unexpected_int64 if {self._read_byte()} else None'
+        return f'_unpack_int64(read_fun(8))[0] if {self._read_byte()} else None'
 
     def read_base_string(self):
         """Read a base UTF-8 string"""
         if not _DEBUG:
             return f"read_fun({self.read_varint()}).decode()"
-        return "_Codegen._debug_read_base_string(read_fun)"
+        return "_debug_read_base_string(read_fun)"
 
     @staticmethod
     def _debug_read_base_string(read_fun):
@@ -177,17 +237,30 @@ class _Codegen:
         """Read an optional string, returning None if not present"""
         return f'{self.read_base_string()} if {self._read_byte()} else None'
 
+    def read_interned_string(self):
+        """Read an optional string, interning it if present
+
+        Used for the fields in Object._intern_fields, which repeat heavily
+        across records, so that all the copies share a single str.
+        """
+        return (f'intern({self.read_base_string()}) if {self._read_byte()} ' +
+                'else None')
+
     def read_object(self, cls_name, /):
         """Read an optional object field, returning None if not present"""
         # There are two layers of optional: An outer one on the field and an
         # inner one on the object itself. It's essentially redundant, they
         # both mean the same thing.
-        return (f'{cls_name}(read_fun, tell_fun) if {self._read_byte()} ' +
+        return (f'_read_{cls_name}(read_fun) if {self._read_byte()} ' +
             f'and {self._read_byte()} else None')
 
     def read_enum(self, cls_name, /):
-        """Read an enum, which is just a typed int"""
-        return f'{cls_name}({self.read_int32()})'
+        """Read an enum, which is just a typed int
+
+        The value is looked up in an _EnumLookup, instead of calling the enum
+        class, because Enum's constructor runs Python-level code.
+        """
+        return f'_enum_{cls_name}[{self.read_int32()}]'
 
     def read_optional_enum(self, cls_name, /):
         """Read an optional enum, returning None if not present"""
@@ -203,18 +276,21 @@ class _Codegen:
 
     def read_raw_array(self, cls_name, /):
         """Read an array of optional objects"""
-        return (f'_Codegen.read_raw_array_real({cls_name}, ' +
-            'read_fun, tell_fun)')
+        return f'_read_raw_array_real({cls_name}, read_fun)'
 
     @staticmethod
-    def read_raw_array_real(clz, read_fun, tell_fun, /):
+    def read_raw_array_real(clz, read_fun, /):
         """Performs actual array parsing, but not primarily used in non-debug"""
+        # from_bytes() rather than a Struct, so that an empty file reads as
+        # an empty array. This only runs once per file in non-debug.
         alen = int.from_bytes(read_fun(4), 'little', signed=True)
         if _DEBUG:
             print(f'Array len: {alen} for {clz.__name__}')
         # Arrays only have the single inner level of optionality, so we can't
-        # use read_object().
-        return [clz(read_fun, tell_fun) if read_fun(1)[0] else None
+        # use read_object(). The parser is looked up once, rather than per
+        # element; this is the loop that reads every top-level record.
+        parse_fun = clz._read
+        return [parse_fun(read_fun) if read_fun(1)[0] else None
                 for x in range(alen)]
 
     def read_array(self, name, cls_name, /):
@@ -231,71 +307,147 @@ class _Codegen:
         # create.
         if _DEBUG:
             return (f'    self.{name} = None if not {self._read_byte()} else ' +
-                    f'_Codegen.read_raw_array_real({cls_name}, read_fun, tell_fun)')
-        return f"""    if not {self._read_byte()}:
+                    f'_read_raw_array_real({cls_name}, read_fun)')
+
+        # The presence flag and the length are fetched with a single read.
+        # That overshoots by 4 bytes when the array isn't present, which is
+        # rare enough that seeking back is cheaper than a second read for
+        # every array. The per-element presence flags can't be fetched in
+        # bulk the same way, since they are interleaved with the elements.
+        return f"""    alen = read_fun(5)
+    if alen == b'\\1\\0\\0\\0\\0':
+        self.{name} = ()
+    elif not alen[0]:
+        read_fun.__self__.seek(1 - len(alen), 1)
         self.{name} = None
     else:
-        alen = read_fun(4)
-        if alen == b'\\0\\0\\0\\0':
-            self.{name} = ()
-        else:
-            alen = int.from_bytes(alen, 'little', signed=True)
-            self.{name} = [{cls_name}(read_fun, tell_fun)
-                if {self._read_byte()} else None for i in range(alen)]"""
+        alen = _unpack_int32_from(alen, 1)[0]
+        self.{name} = [_read_{cls_name}(read_fun)
+            if {self._read_byte()} else None for i in range(alen)] or ()"""
 
     def read_array_int32(self):
         """Read an optional array of int32s.
 
-        Needs special logic because the ints aren't optional.
+        Needs special logic because the ints aren't optional. The whole array
+        is decoded in bulk, by _read_int32s().
         """
         return (f"None if not {self._read_byte()} else " +
-                f"[{self.read_int32()} for x in range({self.read_int32()})]")
+                f"_read_int32s({self.read_int32()}, read_fun)")
+
+    @staticmethod
+    def _read_int32s(alen, read_fun, /):
+        """Performs actual int32 array decoding
+
+        array() is a straight memcpy in the machine's byte order, so the
+        result is byteswapped on big-endian machines. A negative length is
+        an empty array, rather than a read to the end of the file.
+        """
+        if alen <= 0:
+            return []
+        result = array('i', read_fun(alen * 4))
+        if _BIG_ENDIAN:
+            result.byteswap()
+        return result.tolist()
 
     def read_bad_type(self):
         """Used to check that a given class is never deserialized."""
         return "0; raise ValueError('Tried to parse unexpected type')"
 
-    def generate_init(self, layout, cls_name, /):
-        """Generates the dynamic __init__ code for the given class layout"""
-        code = ["""def __init__(self, read_fun=None, tell_fun=None, /, **kwargs):
-    if read_fun is None:"""]
-        # Start with code to initialize the object as a tuple, including the
-        # default constructor case.
+    def generate_init(self, layout, cls_name, intern_fields, /):
+        """Generates the dynamic __init__ and _read code for the given class layout
+
+        The functions are named _init_<cls_name> and _read_<cls_name>, so that
+        all the classes' code can share one namespace.
+
+        __init__ is the default constructor, taking optional field values as
+        kwargs. _read is the parser, which creates the object directly with
+        object.__new__ and fills it from a reader. Keeping them separate keeps
+        the default-value code out of the parsing path entirely, and calling
+        _read as a plain function is cheaper than going through type.__call__.
+        """
+        code = [f'def _init_{cls_name}(self, /, **kwargs):']
+        # The code to initialize the object from a reader is built up in the
+        # same pass, and appended after the default constructor.
+        read_code = [f'def _read_{cls_name}(read_fun, /):',
+                     f'    self = _new({cls_name})']
+        # Consecutive fixed-size fields are collected here, so they can be
+        # read together by read_fixed_run().
+        run = []
         for name, typ in layout:
-            if typ.startswith('object') or typ.startswith('optional'):
+            index = typ.index('(')
+            method_name = typ[:index]
+            # Start with code to initialize the object as a tuple, including
+            # the default constructor case.
+            if method_name.startswith(('object', 'optional')):
                 value = None
-            elif typ.startswith('string'):
+            elif method_name == 'string':
                 value = ''
-            elif typ.startswith('array'):
+            elif method_name.startswith('array'):
                 value = []
-            elif typ.startswith('bool'):
-                value = False
             else:
                 value = 0
-            code.append(f'        self.{name} = {value!r}')
-        code.append("""        for k, v in kwargs.items():
-            setattr(self, k, v)
-        return""")
-        # Otherwise, if there is a reader initialize from it.
-        for name, typ in layout:
-            if _DEBUG:
-                code.append(
-                    f"    print(f'@{{tell_fun():X}} {cls_name} {name}')")
-            index = typ.index('(')
-            method_name = typ[:index]
-            method = getattr(self, 'read_' + method_name)
+            code.append(f'    self.{name} = {value!r}')
+            # Otherwise, if there is a reader initialize from it.
+            if method_name == 'string' and name in intern_fields:
+                method_name = 'interned_string'
             args = []
             if index < len(typ) - 2:
                 args.append(typ[index+1:-1])
+            if method_name in _FIXED_FORMATS and not _DEBUG:
+                run.append((name, method_name, args))
+                continue
+            if run:
+                read_code.append(self.read_fixed_run(run))
+                run = []
+            if _DEBUG:
+                read_code.append(
+                    f"    print(f'@{{read_fun.__self__.tell():X}} {cls_name} {name}')")
+            method = getattr(self, 'read_' + method_name)
             if method_name == 'array':
-                code.append(method(name, *args))
+                read_code.append(method(name, *args))
             else:
-                code.append(f'    self.{name} = ' + method(*args))
-        return '\n'.join(code)
+                read_code.append(f'    self.{name} = ' + method(*args))
+        if run:
+            read_code.append(self.read_fixed_run(run))
+        code.append("""    for k, v in kwargs.items():
+        setattr(self, k, v)""")
+        read_code.append('    return self')
+        return '\n'.join(code + read_code)
+
+    def read_fixed_run(self, run, /):
+        """Read a run of consecutive fixed-size fields
+
+        Like read_array, this returns statements. The run is a list of
+        (name, method_name, args) for fields whose method_name is in
+        _FIXED_FORMATS. When there is more than one, they are fetched with a
+        single read and decoded with a single Struct unpack, which is shared
+        between all classes with the same run format.
+        """
+        if len(run) == 1:
+            name, method_name, args = run[0]
+            method = getattr(self, 'read_' + method_name)
+            return f'    self.{name} = ' + method(*args)
+        fmt = ''.join(_FIXED_FORMATS[x[1]] for x in run)
+        unpacker = '_unpack_' + fmt
+        if unpacker not in _GEN_GLOBALS:
+            _GEN_GLOBALS[unpacker] = Struct('<' + fmt).unpack
+        targets = []
+        enums = []
+        for name, method_name, args in run:
+            if method_name == 'enum':
+                # Enums get unpacked into a temporary, and wrapped afterwards.
+                targets.append(f'enum_{name}')
+                enums.append(
+                    f'    self.{name} = _enum_{args[0]}[enum_{name}]')
+            else:
+                targets.append(f'self.{name}')
+        return '\n'.join(
+            [f'    {", ".join(targets)} = ' +
+             f'{unpacker}(read_fun({calcsize("<" + fmt)}))'] + enums)
 
     def generate_do_all(self, layout, cls_name, /):
         """Generates the dynamic do_all code for the given class layout"""
-        code = [f"""def do_all(self, fun, /):
+        code = [f"""def _do_all_{cls_name}(self, fun, /):
     fun(self, {cls_name})"""]
         for name, typ in layout:
             if typ.startswith('object'):
@@ -311,6 +463,108 @@ class _Codegen:
         return '\n'.join(code)
 
 
+class _EnumLookup(dict):
+    """Maps values to members of an IntEnum, for use by the generated code.
+
+    A dict lookup is about 10x faster than calling the enum class. Misses
+    fall back to the enum class, so invalid values still raise the usual
+    ValueError.
+    """
+    __slots__ = ('enum_cls',)
+
+    def __init__(self, enum_cls, /):
+        super().__init__((x.value, x) for x in enum_cls)
+        self.enum_cls = enum_cls
+
+    def __missing__(self, key):
+        return self.enum_cls(key)
+
+
+# _Codegen keeps no state, so one instance is shared by all the classes.
+_CODEGEN = _Codegen()
+
+
+# The globals that the generated code runs against. The helpers are bound
+# to bare names here, so that the generated code doesn't need an attribute
+# lookup on _Codegen to get to them. The types are filled in at the bottom
+# of the module, once they've all been defined.
+_GEN_GLOBALS = {
+    '_debug_read_base_string': _Codegen._debug_read_base_string,
+    '_read_int32s': _Codegen._read_int32s,
+    '_read_raw_array_real': _Codegen.read_raw_array_real,
+    '_read_varint_rest': _Codegen._read_varint_rest,
+    '_unpack_float': _unpack_float,
+    '_unpack_int32': _unpack_int32,
+    '_unpack_int32_from': _unpack_int32_from,
+    '_unpack_int64': _unpack_int64,
+    '_new': object.__new__,
+    'intern': sys.intern,
+}
+
+# (class, source) pairs for the generated code, waiting on _compile_parsers().
+_PENDING_PARSERS = []
+# Set once this module's own classes have been compiled. Subclasses defined
+# after that (in other modules) are compiled as soon as they're defined.
+_PARSERS_COMPILED = False
+
+
+def _compile_parsers(namespace=_GEN_GLOBALS, /):
+    # pylint: disable=exec-used
+    """Compiles the generated code for all pending classes at once
+
+    A single compile() of one big source is cheaper than a compile() per
+    class. The functions are defined straight into the namespace, which is
+    where the generated code looks up the other classes' parsers anyway.
+    """
+    try:
+        exec(compile('\n\n'.join(x[1] for x in _PENDING_PARSERS),
+                     '<dynamic parser code>', 'exec'), namespace)
+        for cls, _ in _PENDING_PARSERS:
+            cls_name = cls.__name__
+            __init__ = namespace.pop('_init_' + cls_name)
+            __init__.__name__ = '__init__'
+            __init__.__qualname__ = f'{cls_name}.__init__'
+            cls.__init__ = __init__
+            # Other classes' generated code refers to the parser by name, so
+            # it stays in the namespace.
+            parse_fun = namespace['_read_' + cls_name]
+            parse_fun.__name__ = '_read'
+            parse_fun.__qualname__ = f'{cls_name}._read'
+            cls._read = staticmethod(parse_fun)
+            do_all_fun = namespace.pop('_do_all_' + cls_name)
+            do_all_fun.__name__ = 'do_all'
+            do_all_fun.__qualname__ = f'{cls_name}.do_all'
+            cls.do_all = do_all_fun
+    finally:
+        # Don't let a failure leave the classes queued, or every later
+        # compile would fail on them too.
+        _PENDING_PARSERS.clear()
+
+
+def _add_types(namespace, source, /):
+    """Adds the Object and IntEnum classes in source to a generated code namespace
+
+    The generated code refers to classes and their parsers by bare name,
+    and looks up enum members through an _EnumLookup named _enum_<name>.
+    Names that are already bound to something other than a class (the
+    helpers) are left alone.
+    """
+    for name, value in list(source.items()):
+        if not (isinstance(value, type) and issubclass(value, (Object, IntEnum))
+                and isinstance(namespace.get(name, type), type)):
+            continue
+        namespace[name] = value
+        if issubclass(value, IntEnum):
+            namespace['_enum_' + name] = _EnumLookup(value)
+        elif hasattr(value, '_read'):
+            namespace['_read_' + name] = value._read
+
+
+# Attributes that are sorted to the front by Object.__str__, in order. The
+# values sort before any (non-negative) layout position.
+_FRONT_ATTRS = {'id': -3, 'name': -2, 'description': -1}
+
+
 class Object:
     """Generic object base type that powers the rest of the type hierarchy.
 
@@ -323,8 +577,14 @@ class Object:
     (all) subclasses.
     """
 
+    # String fields that get interned while parsing. These are the ones that
+    # repeat across many records; subclasses can override this.
+    _intern_fields = frozenset(
+        ('css_classes', 'tag', 'image', 'image_name', 'second_image',
+         'owner_name', 'name'))
+
     def __init_subclass__(cls):
-        # pylint: disable=exec-used,no-member
+        # pylint: disable=no-member
         """Generates code for subclasses"""
         layout = [x.strip().split(':', 1) for x in cls._layout.strip().split('\n')]
         for field in layout:
@@ -333,39 +593,51 @@ class Object:
                 field[1] += '()'
         cls.__slots__ = tuple(x[0] for x in layout)
         # We dynamically create this code, so that it will be compiled once
-        # and then run at full speed.
-        localz = {}
-        exec(compile(_Codegen().generate_init(layout, cls.__name__) + '\n' +
-                     _Codegen().generate_do_all(layout, cls.__name__),
-                     f'<dynamic {cls.__name__} code>', 'exec'),
-             globals(), localz)
-        __init__ = localz['__init__']
-        __init__.__qualname__ = f'{cls.__name__}.__init__'
-        cls.__init__ = __init__
-        do_all_fun = localz['do_all']
-        do_all_fun.__qualname__ = f'{cls.__name__}.do_all'
-        cls.do_all = do_all_fun
+        # and then run at full speed. It is only generated here; the code for
+        # all the classes is compiled together by _compile_parsers().
+        _PENDING_PARSERS.append((cls, _CODEGEN.generate_init(
+            layout, cls.__name__, cls._intern_fields) + '\n' +
+            _CODEGEN.generate_do_all(layout, cls.__name__)))
         # Precompute replacement string for speed
         fmt = ', '.join(x + '={!r}' for x in cls.__slots__)
         cls._repr_format = f'{cls.__name__}({fmt})'
 
-        # We sort these to the front.
-        front_attrs = ('id', 'name', 'description')
-        str_attrs = [
-            (front_attrs.index(v[0]) - 100 if v[0] in front_attrs else i,
-                v[0], v[1]) for i,v in enumerate(layout)]
-        str_attrs.sort()
         # Objects need to be recursively expanded with str(). Enums need to
         # use str() because repr() doesn't produce an expression which
         # evaluates to the value (which is against style). Lists are handled
         # specially, and will use str() because they contain Objects (or
-        # ints). Everything else should use repr().
-        str_attrs = [(x[1], x[1] + (
-            '={!s}' if x[2].startswith('object') or x[2].startswith('enum')
-            else '={!r}')) for x in str_attrs]
+        # ints). Everything else should use repr(). The _FRONT_ATTRS are
+        # sorted to the front.
+        str_attrs = sorted(
+            (_FRONT_ATTRS.get(name, i), name,
+                name + ('=%s' if typ.startswith(('object', 'enum'))
+                        else '=%r'))
+            for i, (name, typ) in enumerate(layout))
+        str_attrs = [x[1:] for x in str_attrs]
         cls._str_attrs = str_attrs
+        # Fetches all the values in str_attrs order with one C-level call.
+        # attrgetter() only returns a tuple when given multiple names.
+        getter = attrgetter(*[x[0] for x in str_attrs])
+        if len(str_attrs) == 1:
+            def str_values(obj, /):
+                return (getter(obj),)
+        else:
+            str_values = getter
+        cls._str_values = staticmethod(str_values)
         cls._str_begin = f'{cls.__name__}('
 
+        if _PARSERS_COMPILED:
+            # Defined after import, so there's no batch to wait for. The code
+            # gets its own copy of the globals, with the defining module's
+            # types added, so that they can't shadow this module's types for
+            # its own parsers. The class isn't bound in its module yet.
+            namespace = _GEN_GLOBALS.copy()
+            module = sys.modules.get(cls.__module__)
+            if module:
+                _add_types(namespace, vars(module))
+            namespace[cls.__name__] = cls
+            _compile_parsers(namespace)
+
     def __repr__(self):
         """Print all the attributes of the class.
 
@@ -387,12 +659,11 @@ class Object:
         have been ommitted entirely (None) and will be reconstructed as ''.
         """
         acc = []
-        for attr, fmt in self._str_attrs:
-            value = getattr(self, attr)
+        for (attr, fmt), value in zip(self._str_attrs, self._str_values(self)):
             if not value:
                 continue
             if not isinstance(value, list):
-                acc.append(fmt.format(value))
+                acc.append(fmt % (value,))
             else:
                 # Special handling for arrays: This takes advantage of the
                 # fact that it shares the same delimiter: ', '. Arrays are
@@ -1223,6 +1494,10 @@ class World(Object):
     id:int32
     """
 
+_compile_parsers()
+_add_types(_GEN_GLOBALS, globals())
+_PARSERS_COMPILED = True
+
 _ALL_DATA_TYPES = [
     ('areas', Area),
     ('bargains', Bargain),
@@ -1235,12 +1510,16 @@ _ALL_DATA_TYPES = [
 
 _VALID_TYPES = [x[0] for x in _ALL_DATA_TYPES] + ['backers']
 
+# Maps each valid type to its class; backers is a plain list of names.
+_TYPE_MAP = dict(_ALL_DATA_TYPES, backers=None)
+
 def _load_backers(filename=None, /):
     """Load the backers list."""
     filename = filename or 'backers.dat'
-    with closing(_Reader(filename)) as reader:
-        backers = [x.decode() for x in reader.read_fun().split(b'\r\n')]
-    if all(x == '\0' for x in backers[-1]):
+    # Decoding once and then splitting avoids a decode() per line; the
+    # delimiter is ASCII, so the result is the same.
+    backers = _Reader(filename).read_fun().decode().split('\r\n')
+    if not backers[-1].strip('\0'):
         del backers[-1]
     return backers
 
@@ -1251,16 +1530,18 @@ def load_data(data_type, filename=None, /):
     without '.dat'. The filename defaults the the data_type + '.dat', in the
     current directory, but can be overridden.
     """
-    if data_type not in _VALID_TYPES:
+    try:
+        cls = _TYPE_MAP[data_type]
+    except KeyError:
         raise ValueError(
-            f'{data_type!r} is not one of the valid types: {_VALID_TYPES}')
-    if data_type == 'backers':
+            f'{data_type!r} is not one of the valid types: {_VALID_TYPES}'
+        ) from None
+    if cls is None:
         return _load_backers(filename)
     if not filename:
         filename = data_type + '.dat'
-    cls = _ALL_DATA_TYPES[_VALID_TYPES.index(data_type)][1]
-    with closing(_Reader(filename)) as reader:
-        return _Codegen.read_raw_array_real(cls, *reader.get_funcs())
+    reader = _Reader(filename)
+    return _Codegen.read_raw_array_real(cls, reader.read_fun)
 
 GameData = collections.namedtuple('GameData', _VALID_TYPES)
 GameData.__doc__ = """namedtuple result type of load_all()"""
@@ -1273,8 +1554,12 @@ def load_all(root_dir='.', /):
 
     The fields on the tuple have the same names as the data files, but without
     '.dat' - for instance events.dat is loaded into events."""
-    result = dict((x, load_data(x, path.join(root_dir, x + '.dat')))
-                  for x in _VALID_TYPES)
+    result = {}
+    for x in _VALID_TYPES:
+        start = perf_counter()
+        result[x] = load_data(x, path.join(root_dir, x + '.dat'))
+        if _PROFILE:
+            print(f'{x}: {perf_counter() - start:.3f}s', file=sys.stderr)
     return GameData(**result)
 
 def do_all(obj, fun, /):
@@ -25,6 +25,7 @@ These must be extracted from the game files. See the module help in
 
 import argparse
 import enum
+import functools
 import re
 import sys
 
@@ -37,8 +38,15 @@ def init_globals(data):
     for item in data.areas:
         AREAS_MAP[item.id] = item
 
+# typed=True, because members of different IntEnums (and ints) with the
+# same value compare equal.
+@functools.lru_cache(maxsize=None, typed=True)
 def pascal_case(value):
-    """Convert strings or enums to PascalCase"""
+    """Convert strings or enums to PascalCase
+
+    The results are cached, since this is called with the same few enum
+    members for every row of the raw dumps.
+    """
     if isinstance(value, enum.Enum):
         value = value.name
     return value.title().replace('_', '')
@@ -96,12 +104,18 @@ def dump_raw_events(data, /, sort=False):
     events = data.events
     if sort:  # Don't modify actual collection
         events = sorted(events, key=lambda x: x.id)
+    # Many events share each area, so the formatted area is only built once
+    # per area id.
+    area_cache = {}
     for item in events:
         fmt = '* {}: [[{}]] {}|{}'
         area = ''
         if item.limited_to_area:
-            area = '({}) '.format(
-                sanitize(AREAS_MAP[item.limited_to_area.id].name))
+            area_id = item.limited_to_area.id
+            area = area_cache.get(area_id)
+            if area is None:
+                area = area_cache[area_id] = '({}) '.format(
+                    sanitize(AREAS_MAP[area_id].name))
         image = ''
         if item.image:
             image = f' [[:File:{item.image}.png]]'